@@ -16,9 +16,7 @@ from tsutils import utilities
 from tsutils import app_logging as al
 from tsutils import configuration
 from .uicomp.selectable_text import SelectableText
-from PIL import Image
 from wordcloud import WordCloud
-from io import BytesIO
 from tkinter import *
 from PIL import ImageTk
 import re
@@ -804,11 +802,9 @@ def popup_msg_close_button_word_cloud(title: str, word_cloud):
     
     # Render the WordCloud to an image
     try:
-        buffer = BytesIO()
-        word_cloud.to_image().save(buffer, format="PNG")
-        buffer.seek(0)
-        img = Image.open(buffer)
-        img_tk = ImageTk.PhotoImage(img)
+        # to_image already returns a PIL image, hand it to Tk directly
+        # instead of encoding to PNG and decoding it back.
+        img_tk = ImageTk.PhotoImage(word_cloud.to_image())
     except Exception as e:
         print(f"Error rendering word cloud to image: {e}")
         return
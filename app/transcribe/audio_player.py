@@ -70,21 +70,21 @@ class AudioPlayer:
         This is a blocking method and will return when audio playback is complete.
         For large audio text, this could take several minutes.
         """
-        logger.info(f'{self.__class__.__name__} - play_audio called')  # pylint: disable=W1203
+        logger.info('%s - play_audio called', self.__class__.__name__)
         try:
             audio_obj = gtts.gTTS(speech, lang=lang)
             temp_audio_file = tempfile.mkstemp(dir=self.temp_dir, suffix='.mp3')
             os.close(temp_audio_file[0])
 
             audio_obj.save(temp_audio_file[1])
-            now = time.time()
+            now = time.monotonic()
             with self.play_lock:
 
                 if now - self.last_playback_end < 1.0:
                     logger.info("Skipping potential duplicate within 1s window")
                     return
                 if response_id and response_id in self.played_responses:
-                    logger.info(f"Skipping duplicate playback for {response_id}")
+                    logger.info("Skipping duplicate playback for %s", response_id)
                     return
                 if response_id:
                     self.played_responses.add(response_id)
@@ -119,7 +119,7 @@ class AudioPlayer:
             with self.play_lock:
                 self.stop_current_playback()
                 self.playing = False
-                self.last_playback_end = time.time()
+                self.last_playback_end = time.monotonic()
 
 
 
@@ -121,9 +121,11 @@ class AudioTranscriber:   # pylint: disable=C0115, R0902
         logger.info(self.__class__.__name__)
         while True:
             who_spoke, data, time_spoken = audio_queue.get()
-            logger.info(f'Transcribe Audio Queue. Current time: {datetime.datetime.utcnow()} '
-                        f'- Time Spoken: {time_spoken} by : {who_spoke}, queue_backlog - '
-                        f'{audio_queue.qsize()}')
+            # Runs once per audio chunk: use lazy %-style args so the message
+            # is only formatted when the transcriber logger is enabled for INFO.
+            logger.info('Transcribe Audio Queue. Current time: %s - Time Spoken: %s by : %s, '
+                        'queue_backlog - %s', datetime.datetime.utcnow(), time_spoken,
+                        who_spoke, audio_queue.qsize())
             self._update_last_sample_and_phrase_status(who_spoke, data, time_spoken)
             source_info = self.audio_sources_properties[who_spoke]
 
@@ -134,14 +136,14 @@ class AudioTranscriber:   # pylint: disable=C0115, R0902
                 source_info["process_data_func"](source_info["last_sample"], path)
                 if self.transcribe:
                     with duration.Duration('Transcription (Speech to Text)', screen=False):
-                        logger.info(f'{datetime.datetime.now()} - Begin transcription')
+                        logger.info('%s - Begin transcription', datetime.datetime.now())
                         response = self.stt_model.get_transcription(path)
                         text = self.stt_model.process_response(response)
                         if text != '':
                             self._prune_audio_file(response, who_spoke, time_spoken, path)
 
-                        logger.info(f'{datetime.datetime.utcnow()} = Transcribed text: {text}')
-                        logger.info(f'{datetime.datetime.utcnow()} - End transcription')
+                        logger.info('%s = Transcribed text: %s', datetime.datetime.utcnow(), text)
+                        logger.info('%s - End transcription', datetime.datetime.utcnow())
 
             except Exception as exception:
                 print(exception)
@@ -164,7 +166,7 @@ class AudioTranscriber:   # pylint: disable=C0115, R0902
         prune, prune_id, prune_percent = self.check_for_latency(results)
         # print(f'Prune: {prune}. prune_id: {prune_id}. prune_percent: {prune_percent}')
         if prune:
-            logger.info(f'{datetime.datetime.utcnow()} - Attempted to prune.')
+            logger.info('%s - Attempted to prune.', datetime.datetime.utcnow())
             first, second = self.prune_for_latency(who_spoke=who_spoke,
                                                    original_data_size=original_data_size,
                                                    prune_percent=prune_percent,
@@ -294,8 +296,7 @@ class AudioTranscriber:   # pylint: disable=C0115, R0902
                 # Write wav data to file
                 # Convert to desired sample rate using ffmpeg
                 channels = int(source_info["channels"])
-                p = pyaudio.PyAudio()
-                sample_width = p.get_sample_size(pyaudio.paInt16)
+                sample_width = pyaudio.get_sample_size(pyaudio.paInt16)
                 frame_rate = int(source_info["sample_rate"])
                 file_descritor, file_path = tempfile.mkstemp(suffix=".wav")
                 os.close(file_descritor)
@@ -330,8 +331,7 @@ class AudioTranscriber:   # pylint: disable=C0115, R0902
         if not self.transcribe:
             return
 
-        p = pyaudio.PyAudio()
-        sample_width = p.get_sample_size(pyaudio.paInt16)
+        sample_width = pyaudio.get_sample_size(pyaudio.paInt16)
         frame_rate = int(self.audio_sources_properties["You"]["sample_rate"])
         audio_data = sr.AudioData(data, frame_rate, sample_width)
         with open(temp_file_name, 'w+b') as file_handle:
@@ -347,8 +347,7 @@ class AudioTranscriber:   # pylint: disable=C0115, R0902
         if not self.transcribe:
             return
         channels = int(self.audio_sources_properties["Speaker"]["channels"])
-        p = pyaudio.PyAudio()
-        sample_width = p.get_sample_size(pyaudio.paInt16)
+        sample_width = pyaudio.get_sample_size(pyaudio.paInt16)
         frame_rate = self.audio_sources_properties["Speaker"]["sample_rate"]
         self.write_wav_data_to_file(data,
                                     channels=channels,
@@ -467,7 +466,7 @@ class WhisperTranscriber(AudioTranscriber):
             return (False, 0, 0)
 
         len_speech = float(results['segments'][len_segments-1]['end'])
-        logger.info(f'Segments: {len_segments}. Speech length: {len_speech} seconds.')
+        logger.info('Segments: %s. Speech length: %s seconds.', len_segments, len_speech)
         # print(f'Segments: {len_segments}. Speech length: {len_speech} seconds.')
 
         if len_segments > WHISPER_SEGMENT_PRUNE_THRESHOLD:
@@ -616,8 +615,7 @@ class WhisperCPPTranscriber(AudioTranscriber):
         with wave.open(temp_file_name, 'wb') as wf:
             # print(f'{datetime.datetime.now()} - Writing speaker data into file: {temp_file_name}')
             wf.setnchannels(self.audio_sources_properties["Speaker"]["target_channels"])    # pylint: disable=E1101
-            p = pyaudio.PyAudio()
-            wf.setsampwidth(p.get_sample_size(pyaudio.paInt16))    # pylint: disable=E1101
+            wf.setsampwidth(pyaudio.get_sample_size(pyaudio.paInt16))    # pylint: disable=E1101
             wf.setframerate(self.audio_sources_properties["Speaker"]["target_sample_rate"])    # pylint: disable=E1101
             wf.writeframes(data)    # pylint: disable=E1101
             # print(f'datasize: {len(data)}')
@@ -657,7 +655,7 @@ class WhisperCPPTranscriber(AudioTranscriber):
             return (False, 0, 0)
 
         len_speech_ms = int(results['transcription'][-1]['offsets']['to'])
-        logger.info(f'Segments: {len_segments}. Speech length: {len_speech_ms} milliseconds.')
+        logger.info('Segments: %s. Speech length: %s milliseconds.', len_segments, len_speech_ms)
         # print(f'Segments: {len_segments}. Speech length: {len_speech_ms} milliseconds.')
 
         if len_segments > WHISPERCPP_SEGMENT_PRUNE_THRESHOLD:
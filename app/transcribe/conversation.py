@@ -116,7 +116,6 @@ class Conversation:
         if self._initialized:
             inv_id = appdb().get_invocation_id()
             convo_object: convodb.Conversations = appdb().get_object(convodb.TABLE_NAME)
-            convo_id = convo_object.get_max_convo_id(speaker=persona, inv_id=inv_id)
 
         convo_text = f"{persona}: [{text}]\n\n"
         ui_text = f"{persona}: [{text}]\n"
@@ -136,6 +135,9 @@ class Conversation:
             time_spoken = prev_element[1]
             if self._initialized:
                 # Update DB
+                # Only the update path needs the id of the last row for this persona.
+                # New rows get their id from the insert below.
+                convo_id = convo_object.get_max_convo_id(speaker=persona, inv_id=inv_id)
                 # print(f'Removed: {prev_element}')
                 # print(f'Update DB: {inv_id} - {time_spoken} - {persona} - {text}')
                 convo_object.update_conversation(convo_id, text)
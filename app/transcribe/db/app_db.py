@@ -18,6 +18,16 @@ class DBInitException(Exception):
     pass
 
 
+def _set_sqlite_pragma(dbapi_connection, _connection_record):
+    """Use write ahead logging for every new DB connection.
+    With WAL, synchronous=NORMAL is still safe and avoids an fsync on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+
 class AppDB(Singleton.Singleton):
     """Database associated with Transcribe.
     This class is implemented as a Singleton.
@@ -58,6 +68,7 @@ class AppDB(Singleton.Singleton):
         # C:\....\transcribe\app\transcribe
         db_file_path = self._db_context["db_file_path"]
         self._engine = sqldb.create_engine(f'sqlite:///{db_file_path}')
+        sqldb.event.listen(self._engine, 'connect', _set_sqlite_pragma)
         connection = self._engine.connect()
 
         # Initialize DB logger
@@ -91,9 +102,8 @@ class AppDB(Singleton.Singleton):
     def initialize_app(self):
         """Application initialization
         """
-        engine: Engine = sqldb.create_engine(f'sqlite:///{self._db_context["db_file_path"]}')
         # Insert any necessary data in tables
-        self._tables[appi.TABLE_NAME].insert_start_time(engine=engine)
+        self._tables[appi.TABLE_NAME].insert_start_time(engine=self._engine)
 
     def get_invocation_id(self) -> int:
         """Get the invocation id for this invocation of the application.
@@ -113,5 +123,4 @@ class AppDB(Singleton.Singleton):
     def shutdown_app(self):
         """Application shutdown
         """
-        engine = sqldb.create_engine(f'sqlite:///{self._db_context["db_file_path"]}')
-        self._tables[appi.TABLE_NAME].populate_end_time(engine)
+        self._tables[appi.TABLE_NAME].populate_end_time(self._engine)
@@ -127,7 +127,7 @@ class ApplicationInvocations:
 
         try:
             with Session(engine) as session:
-                invocation = session.query(Invocation).get(self._invocation_id)
+                invocation = session.get(Invocation, self._invocation_id)
                 if invocation:
                     invocation.EndTime = datetime.utcnow()
                     session.commit()
@@ -82,13 +82,16 @@ class GPTResponder:
                     timeout=timeout,
                     stream=True
                 )
-            collected_messages = ""
+            # Summary is only consumed once streaming completes, so collect
+            # chunks in a list and join once instead of repeated concatenation
+            collected_chunks = []
             for chunk in summary_response:
                 chunk_message = chunk.choices[0].delta  # extract the message
                 if chunk_message.content:
                     message_text = chunk_message.content
-                    collected_messages += message_text
+                    collected_chunks.append(message_text)
                     # print(f'{message_text}', end="")
+            collected_messages = ''.join(collected_chunks)
 
             # insert in DB
             inv_id = appdb().get_invocation_id()
@@ -335,7 +338,7 @@ class GPTResponder:
 
             # Attempt to get responses only if transcript has changed
             if transcriber.transcript_changed_event.is_set():
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 transcriber.transcript_changed_event.clear()
 
@@ -343,7 +346,7 @@ class GPTResponder:
                 if self.enabled:
                     self.generate_response_from_transcript()
 
-                end_time = time.time()  # Measure end time
+                end_time = time.perf_counter()  # Measure end time
                 execution_time = end_time - start_time  # Calculate time to execute the function
 
                 remaining_time = self.llm_response_interval - execution_time
@@ -9,16 +9,23 @@ from app.transcribe.uicomp.selectable_text import SelectableText
 
 @unittest.skipIf('DISPLAY' not in os.environ, 'requires display')
 class TestSelectableText(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Creating a Tk interpreter is the expensive part, share one root window
+        cls.root = Tk()
+        cls.root.withdraw()  # Hide the root window
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
     def setUp(self):
-        # Set up a root window and the component for testing
-        self.root = Tk()
-        self.root.withdraw()  # Hide the root window
+        # Each test gets a fresh component, since tests mutate its text
         self.component = SelectableText(self.root)
         self.component.pack()
 
     def tearDown(self):
         self.component.destroy()
-        self.root.destroy()
 
     def test_insert_text_at_top(self):
         self.component.add_text_to_top("First line at top")
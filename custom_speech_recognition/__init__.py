@@ -1322,8 +1322,7 @@ class Recognizer(AudioSource):
 
                 # Retrieve transcription JSON containing transcript.
                 transcript_uri = job['Transcript']['TranscriptFileUri']
-                import urllib.request, json
-                with urllib.request.urlopen(transcript_uri) as json_data:
+                with urlopen(transcript_uri) as json_data:
                     d = json.load(json_data)
                     confidences = []
                     for item in d['results']['items']:
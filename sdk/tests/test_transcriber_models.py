@@ -0,0 +1,29 @@
+import unittest
+from unittest.mock import patch
+from sdk.transcriber_models import MODELS_DIR, WhisperCPPSTTModel
+
+
+class TestWhisperCPPSTTModel(unittest.TestCase):
+
+    def setUp(self):
+        self.config = {'audio_lang': 'en', 'local_transcription_model_file': 'base'}
+        self.model_file = MODELS_DIR + 'base.bin'
+
+    def _isfile(self, *existing):
+        """Stand in for os.path.isfile, returning True only for the given paths"""
+        return lambda path: path in existing
+
+    def test_missing_executable(self):
+        with patch('sdk.transcriber_models.os.path.isfile', side_effect=self._isfile(self.model_file)):
+            with self.assertRaisesRegex(FileNotFoundError, 'WhisperCpp executable not found'):
+                WhisperCPPSTTModel(stt_model_config=self.config)
+
+    def test_executable_fallback_path(self):
+        with patch('sdk.transcriber_models.os.path.isfile',
+                   side_effect=self._isfile(self.model_file, './bin/main.exe')):
+            model = WhisperCPPSTTModel(stt_model_config=self.config)
+        self.assertEqual(model.exe_path, './bin/main.exe')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,9 +6,6 @@ import subprocess
 from enum import Enum
 from abc import abstractmethod
 import openai
-import whisper
-import torch
-from deepgram import (DeepgramClient, FileSource, PrerecordedOptions)
 from tsutils import utilities
 # import pprint
 
@@ -23,6 +20,18 @@ class STTEnum(Enum):
 
 
 MODELS_DIR = f"{utilities.get_data_path(app_name='Transcribe')}/models/"
+WHISPER_MODEL_BASE_URL = 'https://openaipublic.azureedge.net/main/whisper/models/'
+# Hash of the download location of the local whisper model files, keyed by model name
+WHISPER_MODEL_HASHES = {
+    'tiny': '65147644a518d12f04e32d6f3b26facc3f8dd46e5390956a9424a650c0ce22b9',
+    'base': 'ed3a0b6b1c0edf879ad9b11b1af5a0e6ab5db9205f891f668f8b0e6c6326e34e',
+    'small': '9ecf779972d90ba49c06d968637d720dd632c55bbf19d441fb42bf17a411e794',
+    'medium': '345ae4da62f9b3d59415adc60127b97c714f32e89e936602e85993674d08dcb1',
+    'large': 'e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb',
+    'large-v1': 'e4b87e7e0bf463eb8e6956e646f1e277e901512310def2c24bf0e11bd3c28e9a',
+    'large-v2': '81f7c96c852ee8fc832187b0132e569d6c3065a3252ed18e56effd0b6a73e524',
+    'large-v3': 'e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb',
+}
 
 
 class STTModelFactory:
@@ -85,7 +94,14 @@ class WhisperSTTModel(STTModelInterface):
         self.model_name = self.model + ".pt"
         self.model_filename = os.path.join(MODELS_DIR, model_filename)
         self.download_model()
+        # whisper pulls in torch, which takes seconds to import. Import it only
+        # when the local model is actually used.
+        import whisper  # pylint: disable=C0415
+        import torch  # pylint: disable=C0415
         self.audio_model: whisper.Whisper = whisper.load_model(self.model_filename)
+        # Half precision uses the tensor cores on GPU. Whisper does not support
+        # fp16 on CPU and falls back to fp32 with a warning, so enable it only with CUDA.
+        self.fp16 = torch.cuda.is_available()
         print(f'[INFO] Speech To Text - Whisper using GPU: {str(torch.cuda.is_available())}')
         openai.api_key = stt_model_config["api_key"]
 
@@ -96,39 +112,18 @@ class WhisperSTTModel(STTModelInterface):
             return
         print(f'Could not find the transcription model file: {self.model_filename}')
         utilities.ensure_directory_exists(MODELS_DIR)
-        if self.model == 'tiny':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/65147644a518d12f04e32d6f3b26facc3f8dd46e5390956a9424a650c0ce22b9/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'base':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/ed3a0b6b1c0edf879ad9b11b1af5a0e6ab5db9205f891f668f8b0e6c6326e34e/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'small':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/9ecf779972d90ba49c06d968637d720dd632c55bbf19d441fb42bf17a411e794/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'medium':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/345ae4da62f9b3d59415adc60127b97c714f32e89e936602e85993674d08dcb1/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'large':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'large-v1':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/e4b87e7e0bf463eb8e6956e646f1e277e901512310def2c24bf0e11bd3c28e9a/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'large-v2':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/81f7c96c852ee8fc832187b0132e569d6c3065a3252ed18e56effd0b6a73e524/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        elif self.model == 'large-v3':
-            file_url = 'https://openaipublic.azureedge.net/main/whisper/models/e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb/' + self.model_name
-            utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
-        else:
+        model_hash = WHISPER_MODEL_HASHES.get(self.model)
+        if model_hash is None:
             print('Could not find the correct model file')
             sys.exit()
+        file_url = f'{WHISPER_MODEL_BASE_URL}{model_hash}/{self.model_name}'
+        utilities.download_using_bits(file_url=file_url, file_path=self.model_filename)
 
     def get_sentences(self, wav_file_path) -> dict:
         """Get transcription from the provided audio file as individual sentences
         """
         result = self.audio_model.transcribe(wav_file_path,
-                                             fp16=False,
+                                             fp16=self.fp16,
                                              language=self.lang,
                                              temperature=0)
         sentences = []
@@ -146,7 +141,7 @@ class WhisperSTTModel(STTModelInterface):
             # options = {}
             # options['task'] = 'translate'
             result = self.audio_model.transcribe(wav_file_path,
-                                                 fp16=False,
+                                                 fp16=self.fp16,
                                                  language=self.lang,
                                                  temperature=0)
         except Exception as exception:
@@ -162,14 +157,9 @@ class WhisperSTTModel(STTModelInterface):
     def set_lang(self, lang: str):
         """Set Language for STT
         """
+        # Language is passed to transcribe on each call. The model weights do not
+        # depend on it, so the already loaded model is reused.
         self.lang = lang
-        self.download_model()
-        self._load_model()
-
-    def _load_model(self):
-        """Load Model for STT
-        """
-        self.audio_model = whisper.load_model(self.model_filename)
 
     def process_response(self, response) -> str:
         """
@@ -279,6 +269,16 @@ class WhisperCPPSTTModel(STTModelInterface):
                 f'WhisperCpp model file not found: {self.model_filename}. ' +
                 'Please download the file and place it at this location.')
 
+        # Executable lives in ../../bin when running from source, ./bin for the binary
+        for exe_path in ("../../bin/main.exe", "./bin/main.exe"):
+            if os.path.isfile(exe_path):
+                self.exe_path = exe_path
+                break
+        else:
+            raise FileNotFoundError(
+                'WhisperCpp executable not found at ../../bin/main.exe or ./bin/main.exe. ' +
+                'Please ensure the whisper.cpp binary is present at one of these locations.')
+
         print(f'Loading WhisperCpp model: {self.model_filename}')
 
     def set_lang(self, lang: str):
@@ -292,27 +292,20 @@ class WhisperCPPSTTModel(STTModelInterface):
         try:
             log_file = f"{utilities.get_data_path(app_name='Transcribe')}/logs/whisper.cpp.txt"
             # main.exe <filename> -oj
-            if os.path.isfile("../../bin/main.exe"):
-                subprocess.call(["../../bin/main.exe", mod_file_path, '-oj', '-m',
-                                 self.model_filename, '-l', self.lang],
-                                stdout=open(file=log_file, mode='a', encoding='utf-8'),
-                                stderr=subprocess.STDOUT)
-            else:
-                # This path is used in case of binary.
-                subprocess.call(["./bin/main.exe", mod_file_path, '-oj', '-m', self.model_filename,
-                                 '-l', self.lang],
-                                stdout=open(file=log_file, mode='a', encoding='utf-8'),
-                                stderr=subprocess.STDOUT)
+            subprocess.call([self.exe_path, mod_file_path, '-oj', '-m',
+                             self.model_filename, '-l', self.lang],
+                            stdout=open(file=log_file, mode='a', encoding='utf-8'),
+                            stderr=subprocess.STDOUT)
         except Exception as ex:
             print(f'ERROR: converting wav file {wav_file_path} to text using whisper.cpp.')
-            print('Ensure that the file ../../bin/main.exe exists.')
+            print(f'Executable used: {self.exe_path}')
             print(ex)
 
         try:
             # Output is produced in json file wav_file_path.json
             json_file_path = mod_file_path+".json"
             with open(json_file_path, mode="r", encoding='utf-8') as text_file:
-                response = json.loads(text_file.read())
+                response = json.load(text_file)
                 return response
         except Exception as exception:
             print(f'Error reading json file: {json_file_path}')
@@ -326,24 +319,16 @@ class WhisperCPPSTTModel(STTModelInterface):
     def process_response(self, response) -> str:
         # response is of type PrerecordedTranscriptionResponse
         # convert result to the appropriate dict format
-        text = ''
-        for segment in response["transcription"]:
-            if segment["text"].strip() == '[BLANK_AUDIO]':
-                continue
-            text += segment["text"]
+        text = ''.join(segment["text"] for segment in response["transcription"]
+                       if segment["text"].strip() != '[BLANK_AUDIO]')
         # print(f'Transcript: {text}')
         return text
 
     def get_sentences(self, wav_file_path: str):
         """Not Implemented
         """
-        transcript = ''
         response = self.get_transcription(wav_file_path=wav_file_path)
-        for segment in response["transcription"]:
-            if segment["text"].strip() == '[BLANK_AUDIO]':
-                continue
-            transcript += segment["text"]
-        return transcript
+        return self.process_response(response)
 
         # raise Exception('Method not implemnted')  # pylint: disable=W0719
 
@@ -363,7 +348,9 @@ class DeepgramSTTModel(STTModelInterface):
         self.lang = stt_model_config['audio_lang']
 
         print('[INFO] Using Deepgram API for transcription.')
+        from deepgram import (DeepgramClient, PrerecordedOptions)  # pylint: disable=C0415
         self.audio_model = DeepgramClient(stt_model_config["api_key"])
+        self._options_cls = PrerecordedOptions
 
     def set_lang(self, lang: str):
         """Set STT Language"""
@@ -376,11 +363,11 @@ class DeepgramSTTModel(STTModelInterface):
             with open(wav_file_path, "rb") as audio_file:
                 buffer_data = audio_file.read()
 
-            payload: FileSource = {
+            payload: 'FileSource' = {
                 "buffer": buffer_data
                 }
 
-            options = PrerecordedOptions(
+            options = self._options_cls(
                 model="nova",
                 smart_format=True,
                 utterances=True,
@@ -406,11 +393,11 @@ class DeepgramSTTModel(STTModelInterface):
             with open(wav_file_path, "rb") as audio_file:
                 buffer_data = audio_file.read()
 
-            payload: FileSource = {
+            payload: 'FileSource' = {
                 "buffer": buffer_data
                 }
             if self.lang.startswith('en'):
-                options = PrerecordedOptions(
+                options = self._options_cls(
                     model="nova",
                     smart_format=True,
                     utterances=True,
@@ -419,7 +406,7 @@ class DeepgramSTTModel(STTModelInterface):
                     detect_language=True,
                     language=self.lang)
             else:
-                options = PrerecordedOptions(
+                options = self._options_cls(
                     model="general",
                     smart_format=True,
                     utterances=True,
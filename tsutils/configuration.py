@@ -8,6 +8,8 @@ from tsutils import utilities
 
 
 CONFIG_REFRESH_INTERVAL_SECONDS = 10
+# Prefer the libyaml backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 class Config(Singleton.Singleton):
@@ -57,7 +59,7 @@ class Config(Singleton.Singleton):
         """
         try:
             with open(self._default_config_filename, mode='r', encoding='utf-8') as default_config_file:
-                self._default_data = yaml.load(stream=default_config_file, Loader=yaml.SafeLoader)
+                self._default_data = yaml.load(stream=default_config_file, Loader=YAML_LOADER)
 
         except ImportError as err:
             print(f'Failed to load yaml file: {self._default_config_filename}.')
@@ -71,7 +73,7 @@ class Config(Singleton.Singleton):
         try:
             with open(self._override_config_filename, mode='r', encoding='utf-8') as override_config_file:
                 self._override_data = yaml.load(stream=override_config_file,
-                                                Loader=yaml.SafeLoader)
+                                                Loader=YAML_LOADER)
         except ImportError as err:
             print(f'Failed to load yaml file: {self._override_config_filename}.')
             print(f'Error: {err}')
@@ -104,7 +106,7 @@ class Config(Singleton.Singleton):
         yml = Config()
         with open(yml.config_override_file, mode='r', encoding='utf-8') as file:
             try:
-                altered_config = yaml.load(stream=file, Loader=yaml.SafeLoader)
+                altered_config = yaml.load(stream=file, Loader=YAML_LOADER)
                 # Handle empty override file
                 if altered_config is None:
                     altered_config = {}
@@ -3,7 +3,6 @@ import time
 from tsutils import app_logging as al
 
 
-# pylint: disable=logging-fstring-interpolation
 root_logger = al.get_logger()
 
 
@@ -41,7 +40,7 @@ class Duration:
         """
         self.end = datetime.datetime.now()
         if self.log:
-            root_logger.info(f'Duration(hh:mm:ss.ms) of {self.operation_name} {self.end - self.start}')
+            root_logger.info('Duration(hh:mm:ss.ms) of %s %s', self.operation_name, self.end - self.start)
         if self.screen:
             print(f'Duration(hh:mm:ss.ms) of {self.operation_name} {self.end - self.start}')
 
@@ -14,6 +14,13 @@ class TestFunctions(unittest.TestCase):
         result = merge(first, second)
         self.assertEqual(result, {'a': 1, 'b': {'c': 3, 'd': 4}, 'e': 5})
 
+        first = {'a': 1, 'b': {'c': 3, 'd': {'x': 1}}, 'f': {'g': 1}}
+        second = {'a': 2, 'b': {'c': 3, 'd': {'y': 2}}, 'f': 7, 'h': None}
+        result = merge(first, second)
+        self.assertIs(result, first)
+        self.assertEqual(result, {'a': 2, 'b': {'c': 3, 'd': {'x': 1, 'y': 2}},
+                                  'f': 7, 'h': None})
+
     @patch('os.path.exists', side_effect=[True, True, False])
     def test_incrementing_filename(self, mock_exists):
         result = incrementing_filename('file', 'txt')
@@ -24,15 +24,13 @@ def merge(first: dict, second: dict, path=[]):
         first = copy.deepcopy(second)
         return first
 
-    for key in second:
-        if key in first:
-            if isinstance(first[key], dict) and isinstance(second[key], dict):
-                merge(first[key], second[key], path + [str(key)])
-            elif first[key] != second[key]:
-                # print(f'Replacing the value of {key} from {first[key]} to {second[key]}')
-                first[key] = second[key]
+    # Single lookup in each dict per key
+    for key, value in second.items():
+        current = first.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merge(current, value, path + [str(key)])
         else:
-            first[key] = second[key]
+            first[key] = value
     return first
 
 
@@ -307,17 +305,18 @@ def delete_old_files(folder_path: str, days: int):
     current_time = time.time()
     cutoff_time = current_time - (days * 24 * 60 * 60)  # Days in seconds
 
-    for filename in os.listdir(folder_path):
-        file_path = os.path.join(folder_path, filename)
-
-        # Check if it's a file (not a directory)
-        if os.path.isfile(file_path):
-            file_mod_time = os.path.getmtime(file_path)
+    # is_file() usually comes from the directory read itself.
+    # stat() is only cached from it on Windows.
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            # Check if it's a file (not a directory)
+            if not entry.is_file():
+                continue
 
             # Delete the file if it's older than the cutoff time
-            if file_mod_time < cutoff_time:
+            if entry.stat().st_mtime < cutoff_time:
                 try:
-                    os.remove(file_path)
-                    print(f"Deleted: {file_path}")
+                    os.remove(entry.path)
+                    print(f"Deleted: {entry.path}")
                 except Exception as e:
-                    print(f"Error deleting file {file_path}: {e}")
+                    print(f"Error deleting file {entry.path}: {e}")